@@ -3,16 +3,39 @@ Module responsible for generating RFC 5545 compliant ICS files.
 This serves as the 'Harmonizer' output engine.
 """
 
+import os
 import uuid
 import logging
-from datetime import datetime, timedelta
-from typing import List
-from icalendar import Calendar, Event, Alarm
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Tuple
+from icalendar import Calendar
+from icalendar.parser import escape_char, foldline
 from src.models import BirthdayEntry
 from src.config import DEFAULT_ALARM_HOURS
 
 logger = logging.getLogger(__name__)
 
+_CALENDAR_END = b"END:VCALENDAR\r\n"
+
+
+def _text_line(name: str, value: str) -> str:
+    """
+    Renders a TEXT property as an escaped and folded content line.
+
+    Args:
+        name (str): The property name, e.g. SUMMARY.
+        value (str): The unescaped property value.
+
+    Returns:
+        str: The content line without its trailing CRLF.
+    """
+    return foldline(f"{name}:{escape_char(value)}")
+
+
+def _ical_date(value: date) -> str:
+    """Formats a date as an RFC 5545 DATE value (YYYYMMDD)."""
+    return "%04d%02d%02d" % (value.year, value.month, value.day)
+
 
 class ICSGenerator:
     """
@@ -25,52 +48,102 @@ class ICSGenerator:
         self.cal.add("prodid", "-//Birthday Harmonizer//EN")
         self.cal.add("version", "2.0")
         self.cal.add("x-wr-calname", "Harmonized Birthdays")
+        self._desc_cache: Dict[Tuple[bool, int], str] = {}
+        self._date_cache: Dict[date, Tuple[str, str]] = {}
+        self._one_day = timedelta(days=1)
+
+        # Every event shares the same properties in the same order, so the
+        # VEVENT is rendered from one template instead of an icalendar tree.
+        # PT9H = 9 hours after the start of the event (09:00 AM)
+        self._event_template = (
+            "BEGIN:VEVENT\r\n"
+            "%s\r\n"  # SUMMARY
+            "DTSTART;VALUE=DATE:%s\r\n"
+            "DTEND;VALUE=DATE:%s\r\n"
+            "DTSTAMP:%s\r\n"
+            "UID:%s\r\n"
+            "RRULE:FREQ=YEARLY\r\n"
+            "CATEGORIES:Birthday\r\n"
+            "CLASS:PUBLIC\r\n"
+            "CREATED:%s\r\n"
+            "%s\r\n"  # DESCRIPTION
+            "STATUS:CONFIRMED\r\n"
+            "TRANSP:TRANSPARENT\r\n"
+            "BEGIN:VALARM\r\n"
+            "ACTION:DISPLAY\r\n"
+            "%s\r\n"  # Alarm DESCRIPTION
+            f"TRIGGER;RELATED=START:PT{DEFAULT_ALARM_HOURS}H\r\n"
+            "END:VALARM\r\n"
+            "END:VEVENT\r\n"
+        )
 
-    def _create_event(self, entry: BirthdayEntry) -> Event:
+    def _render_event(self, entry: BirthdayEntry, now: str, uid_bytes: bytes) -> str:
         """
         Transforms a BirthdayEntry into a standardized VEVENT.
 
         Args:
             entry (BirthdayEntry): The internal data model.
+            now (str): The formatted build timestamp shared by all events.
+            uid_bytes (bytes): 16 random bytes used for the event UUID.
 
         Returns:
-            Event: A fully populated and harmonized iCalendar event.
+            str: The serialized and harmonized VEVENT block.
         """
-        event = Event()
-
-        # Identity and Timestamps
-        event.add("uid", str(uuid.uuid4()))
-        event.add("dtstamp", datetime.now())
-        event.add("created", datetime.now())
-
-        # Core Birthday Data
-        event.add("summary", entry.name)
-        event.add("dtstart", entry.birth_date)
-        # End date is start date + 1 day for all-day events
-        event.add("dtend", entry.birth_date + timedelta(days=1))
-        event.add("rrule", {"freq": "yearly"})
-
-        # Metadata and State
-        year_text = str(entry.birth_date.year) if entry.has_year else "Unknown"
-        event.add("description", f"Born: {year_text}")
-        event.add("categories", ["Birthday"])
-        event.add("transp", "TRANSPARENT")
-        event.add("status", "CONFIRMED")
-        event.add("class", "PUBLIC")
-
-        # Harmonized Alarm ()
-        alarm = Alarm()
-        alarm.add("action", "DISPLAY")
-        alarm.add("description", f"Birthday Reminder: {entry.name}")
-        # PT9H = 9 hours after the start of the event (09:00 AM)
-        alarm.add(
-            "trigger",
-            timedelta(hours=DEFAULT_ALARM_HOURS),
-            parameters={"RELATED": "START"},
+        # Descriptions repeat heavily (shared years, "Unknown"), so reuse them
+        key = (entry.has_year, entry.birth_date.year)
+        description = self._desc_cache.get(key)
+        if description is None:
+            year_text = str(entry.birth_date.year) if entry.has_year else "Unknown"
+            description = self._desc_cache[key] = _text_line(
+                "DESCRIPTION", f"Born: {year_text}"
+            )
+
+        # Birthdays share a limited set of dates, so DTSTART/DTEND pairs repeat
+        dates = self._date_cache.get(entry.birth_date)
+        if dates is None:
+            dates = self._date_cache[entry.birth_date] = (
+                _ical_date(entry.birth_date),
+                # End date is start date + 1 day for all-day events
+                _ical_date(entry.birth_date + self._one_day),
+            )
+        dtstart, dtend = dates
+
+        return self._event_template % (
+            _text_line("SUMMARY", entry.name),
+            dtstart,
+            dtend,
+            now,
+            uuid.UUID(bytes=uid_bytes, version=4),
+            now,
+            description,
+            _text_line("DESCRIPTION", f"Birthday Reminder: {entry.name}"),
         )
-        event.add_component(alarm)
 
-        return event
+    def iter_ical(self, entries: List[BirthdayEntry]) -> Iterator[bytes]:
+        """
+        Serializes the calendar piece by piece instead of as one document.
+
+        Yields the VCALENDAR header, then each VEVENT, then the closing
+        line, so callers can write the output without holding the whole
+        calendar in memory.
+
+        Args:
+            entries (List[BirthdayEntry]): The data to be written.
+
+        Yields:
+            bytes: Consecutive CRLF-terminated fragments of the ICS file.
+        """
+        yield self.cal.to_ical()[: -len(_CALENDAR_END)]
+
+        # Formatted once per build; RFC 5545 requires DTSTAMP in UTC
+        now = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        # One urandom draw for all UUIDs; UUID(version=4) sets the RFC 4122 bits
+        raw = os.urandom(16 * len(entries))
+        for i, entry in enumerate(entries):
+            uid_bytes = raw[i * 16 : (i + 1) * 16]
+            yield self._render_event(entry, now, uid_bytes).encode("utf-8")
+
+        yield _CALENDAR_END
 
     def build(self, entries: List[BirthdayEntry]) -> bytes:
         """
@@ -82,7 +155,4 @@ class ICSGenerator:
         Returns:
             bytes: The serialized ICS file content.
         """
-        for entry in entries:
-            self.cal.add_component(self._create_event(entry))
-
-        return self.cal.to_ical()
+        return b"".join(self.iter_ical(entries))
@@ -29,13 +29,12 @@ def main() -> None:
 
     # 2. Generate harmonized ICS
     generator = ICSGenerator()
-    clean_ics = generator.build(birthday_data)
 
-    # 3. Write to output
+    # 3. Stream to output
     output_path = "data/output.ics"
     try:
         with open(output_path, "wb") as f:
-            f.write(clean_ics)
+            f.writelines(generator.iter_ical(birthday_data))
         logger.info(f"Harmonization complete! Clean file saved to: {output_path}")
     except IOError as e:
         logger.error(f"Failed to write output file: {e}")
@@ -7,13 +7,36 @@ non-standard or messy iCalendar entries.
 import re
 import logging
 from datetime import date
-from typing import List, Optional
-from icalendar import Calendar, Event
+from typing import Any, List, Optional
+from icalendar import Calendar
 from src.models import BirthdayEntry
 from src.config import SENTINEL_YEAR
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import time; matches a standalone year from 1900 to 2099.
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_DIGITS = frozenset("0123456789")
+
+
+def _as_str(value: Any, default: str = "") -> str:
+    """
+    Converts an ICS property value to a plain string.
+
+    Values that already are exact ``str`` instances are returned as-is,
+    so only wrapped icalendar types pay for a conversion.
+
+    Args:
+        value (Any): The raw property value, or None if it is missing.
+        default (str): The fallback used when the property is missing.
+
+    Returns:
+        str: The property value as a string.
+    """
+    if value is None:
+        return default
+    return value if type(value) is str else str(value)
+
 
 class ICSParser:
     """
@@ -44,7 +67,10 @@ class ICSParser:
         Returns:
             Optional[int]: The extracted year as an integer if found, else None.
         """
-        match = re.search(r"\b(19|20)\d{2}\b", text)
+        # Cheap pre-check: most fields carry no digits at all
+        if _DIGITS.isdisjoint(text):
+            return None
+        match = _YEAR_RE.search(text)
         return int(match.group(0)) if match else None
 
     def _clean_name(self, summary: str, uid: str) -> str:
@@ -63,7 +89,7 @@ class ICSParser:
         """
         name = summary.strip()
         if not name:
-            logger.warning(f"Empty summary found for UID: {uid}. Using placeholder.")
+            logger.warning("Empty summary found for UID: %s. Using placeholder.", uid)
             return f"Unknown Birthday ({uid[:8]})"
         return name
 
@@ -81,35 +107,36 @@ class ICSParser:
 
         try:
             with open(self.file_path, "rb") as f:
-                content = f.read().decode("utf-8")
-                cal = Calendar.from_ical(content)
+                cal = Calendar.from_ical(f.read())
         except Exception as e:
             logger.error(f"Failed to read file {self.file_path}: {e}")
             return entries
 
+        current_year = date.today().year
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for event in cal.walk("VEVENT"):
-            if not isinstance(event, Event):
-                continue
-
             # 1. Extract Basic Data
-            uid = str(event.get("UID", "no-uid"))
-            summary = str(event.get("SUMMARY", ""))
-            description = str(event.get("DESCRIPTION", ""))
+            uid = _as_str(event.get("UID"), "no-uid")
+            summary = _as_str(event.get("SUMMARY"))
+            description = _as_str(event.get("DESCRIPTION"))
             dtstart = event.get("DTSTART").dt
 
             # Ensure we are working with a date object
             if not isinstance(dtstart, date):
-                logger.debug(f"Skipping non-date event: {summary}")
+                logger.debug("Skipping non-date event: %s", summary)
                 continue
 
             # 2. Waterfall Year Extraction
-            # Check description first, then summary, then DTSTART if it's old
-            birth_year = self._extract_year(description) or self._extract_year(summary)
+            # Check description first, then summary, then DTSTART if it's old.
+            # A single scan over both fields keeps that priority, since the
+            # first match in the description precedes anything in the summary.
+            # The newline separator keeps a year from straddling the two fields.
+            birth_year = self._extract_year(f"{description}\n{summary}")
 
             has_year = True
             if not birth_year:
                 # If DTSTART year is reasonably in the past, treat it as birth year
-                if dtstart.year < date.today().year - 1:
+                if dtstart.year < current_year - 1:
                     birth_year = dtstart.year
                 else:
                     birth_year = SENTINEL_YEAR
@@ -123,8 +150,11 @@ class ICSParser:
                 has_year=has_year,
             )
             entries.append(entry)
-            logger.debug(
-                f"Parsed: {entry.name} (Year: {birth_year if has_year else 'Unknown'})"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Parsed: %s (Year: %s)",
+                    entry.name,
+                    birth_year if has_year else "Unknown",
+                )
 
         return entries